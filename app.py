@@ -1,16 +1,15 @@
 import streamlit as st
 import os
 import io
+import shutil
 from datetime import datetime
-import requests
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER
-import pandas as pd
-import base64
+from functools import lru_cache
+from itertools import zip_longest
+import numpy as np
+
+# reportlab, pandas and requests are imported lazily inside the functions
+# that need them, so the first page paint is not delayed by modules the
+# user may never exercise (sys.modules makes repeat imports near-free).
 
 # Program details
 PROGRAM_VERSION = "1.0 - 2025"
@@ -20,10 +19,14 @@ PROGRAM = "Load Combination Calculator to AS 3610.2 (Int):2023"
 COMPANY_NAME = "tekhne Consulting Engineers"
 COMPANY_ADDRESS = ""
 
+# Static part of the per-page footer; only the page number varies
+FOOTER_PREFIX = f"{PROGRAM} {PROGRAM_VERSION} | {COMPANY_NAME} © | Page "
+
 # Logo URLs
 LOGO_URL = "https://drive.google.com/uc?export=download&id=1VebdT2loVGX57noP9t2GgQhwCNn8AA3h"
 FALLBACK_LOGO_URL = "https://onedrive.live.com/download?cid=A48CC9068E3FACE0&resid=A48CC9068E3FACE0%21s252b6fb7fcd04f53968b2a09114d33ed"
 
+@lru_cache(maxsize=128)
 def calculate_concrete_load(thickness, reinforcement_percentage):
     """Calculate G_c in kN/m² based on concrete thickness and reinforcement percentage."""
     base_density = 24  # kN/m³
@@ -31,176 +34,372 @@ def calculate_concrete_load(thickness, reinforcement_percentage):
     G_c = base_density * thickness + reinforcement_load * thickness
     return G_c
 
+# Load combination coefficient tables from AS 3610.2 (Int):2023 Table 3.3.1.
+# Columns follow the load vector order:
+#   [G_f, G_c, Q_w, Q_m, Q_h, W_s, W_u, F_w, Q_x, P_c, I]
+COEFFS_V = {
+    "1": np.array([
+        [1.35, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1.2,  0.0, 1.5, 1.5, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1.2,  0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.5, 0.0, 0.0, 0.0],
+        [0.9,  0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.5, 0.0, 0.0, 0.0],
+        [1.0,  0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.1],
+    ]),
+    "2": np.array([
+        [1.35, 1.35, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1.2,  1.2,  1.5, 1.5, 0.0, 1.0, 0.0, 1.5, 1.5, 1.0, 0.0],
+        [1.0,  1.0,  0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.1],
+    ]),
+    "3": np.array([
+        [1.35, 1.35, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1.2,  1.2,  1.5, 1.5, 0.0, 1.0, 0.0, 1.5, 1.5, 1.0, 0.0],
+        [1.2,  1.2,  0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0],
+        [1.0,  1.0,  0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.1],
+    ]),
+}
+
+COEFFS_H = {
+    "1": np.array([
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 1.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    ]),
+    "2": np.array([
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 1.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    ]),
+    "3": np.array([
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 1.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    ]),
+}
+
+# Rows whose combinations are scaled by gamma_d (per-stage, same order as above)
+GAMMA_MASK = {
+    "1": np.array([False, True, False, False, False]),
+    "2": np.array([True, True, False]),
+    "3": np.array([True, True, False, False]),
+}
+
+def compute_base_combinations(G_f, G_c, Q_w, Q_m, Q_h, W_s, W_u, F_w, Q_x, P_c, I, stage):
+    """Compute the unfactored (gamma_d = 1.0) combination vectors for a stage."""
+    loads = np.array([G_f, G_c, Q_w, Q_m, Q_h, W_s, W_u, F_w, Q_x, P_c, I])
+    return COEFFS_V[stage] @ loads, COEFFS_H[stage] @ loads
+
+def apply_gamma(base_vertical, base_horizontal, stage, gamma_d):
+    """Scale the gamma_d-controlled rows of the base combination vectors.
+
+    Returns the (vertical, horizontal) arrays; the table builders consume
+    them directly without an intermediate list of tuples.
+    """
+    mask = GAMMA_MASK[stage]
+    vertical = base_vertical.copy()
+    horizontal = base_horizontal.copy()
+    vertical[mask] *= gamma_d
+    horizontal[mask] *= gamma_d
+    return vertical, horizontal
+
 def compute_combinations(G_f, G_c, Q_w, Q_m, Q_h, W_s, W_u, F_w, Q_x, P_c, I, stage, gamma_d):
     """Compute load combinations for a given stage and gamma_d."""
-    combinations = []
-
-    if stage == "1":
-        comb_1 = (1.35 * G_f, 0.0)
-        comb_2 = (gamma_d * (1.2 * G_f + 1.5 * Q_w + 1.5 * Q_m + 1.0 * W_s), gamma_d * (1.5 * Q_h))
-        comb_3 = (1.2 * G_f + 1.0 * W_u + 1.5 * F_w, 0.0)
-        comb_4 = (0.9 * G_f + 1.0 * W_u + 1.5 * F_w, 0.0)
-        comb_5 = (1.0 * G_f + 1.1 * I, 0.0)
-        combinations = [comb_1, comb_2, comb_3, comb_4, comb_5]
-    
-    elif stage == "2":
-        comb_6 = (gamma_d * (1.35 * G_f + 1.35 * G_c), 0.0)
-        comb_7 = (gamma_d * (1.2 * G_f + 1.2 * G_c + 1.5 * Q_w + 1.5 * Q_m + 1.0 * W_s + 1.5 * F_w + 1.5 * Q_x + 1.0 * P_c), 
-                 gamma_d * (1.5 * Q_h))
-        comb_8 = (1.0 * G_f + 1.0 * G_c + 1.1 * I, 0.0)
-        combinations = [comb_6, comb_7, comb_8]
-    
-    elif stage == "3":
-        comb_9 = (gamma_d * (1.35 * G_f + 1.35 * G_c), 0.0)
-        comb_10 = (gamma_d * (1.2 * G_f + 1.2 * G_c + 1.5 * Q_w + 1.5 * Q_m + 1.0 * W_s + 1.5 * F_w + 1.5 * Q_x + 1.0 * P_c),
-                  gamma_d * (1.5 * Q_h))
-        comb_11 = (1.2 * G_f + 1.2 * G_c + 1.0 * W_u, 0.0)
-        comb_12 = (1.0 * G_f + 1.0 * G_c + 1.1 * I, 0.0)
-        combinations = [comb_9, comb_10, comb_11, comb_12]
-    
-    return combinations
+    base_vertical, base_horizontal = compute_base_combinations(
+        G_f, G_c, Q_w, Q_m, Q_h, W_s, W_u, F_w, Q_x, P_c, I, stage
+    )
+    vertical, horizontal = apply_gamma(base_vertical, base_horizontal, stage, gamma_d)
+    return list(zip(vertical.tolist(), horizontal.tolist()))
+
+# Combination description strings, built once at import time. _DESC_HTML keeps
+# the <sub> markup for ReportLab paragraphs; _DESC_PLAIN is the stripped
+# version used for the on-screen DataFrames.
+_DESC_HTML = {
+    "1": (
+        "1: 1.35G<sub>f</sub>",
+        "2: 1.2G<sub>f</sub> + 1.5Q<sub>w</sub> + 1.5Q<sub>m</sub> + 1.5Q<sub>h</sub> + 1W<sub>s</sub>",
+        "3: 1.2G<sub>f</sub> + 1W<sub>u</sub> + 1.5F<sub>w</sub>",
+        "4: 0.9G<sub>f</sub> + 1W<sub>u</sub> + 1.5F<sub>w</sub>",
+        "5: 1G<sub>f</sub> + 1.1I"
+    ),
+    "2": (
+        "6: 1.35G<sub>f</sub> + 1.35G<sub>c</sub>",
+        "7: 1.2G<sub>f</sub> + 1.2G<sub>c</sub> + 1.5Q<sub>w</sub> + 1.5Q<sub>m</sub> + 1.5Q<sub>h</sub> + 1W<sub>s</sub> + 1.5F<sub>w</sub> + 1.5Q<sub>x</sub> + P<sub>c</sub>",
+        "8: 1G<sub>f</sub> + 1G<sub>c</sub> + 1.1I"
+    ),
+    "3": (
+        "9: 1.35G<sub>f</sub> + 1.35G<sub>c</sub>",
+        "10: 1.2G<sub>f</sub> + 1.2G<sub>c</sub> + 1.5Q<sub>w</sub> + 1.5Q<sub>m</sub> + 1.5Q<sub>h</sub> + 1W<sub>s</sub> + 1.5F<sub>w</sub> + 1.5Q<sub>x</sub> + P<sub>c</sub>",
+        "11: 1.2G<sub>f</sub> + 1.2G<sub>c</sub> + 1.0W<sub>u</sub>",
+        "12: 1G<sub>f</sub> + 1G<sub>c</sub> + 1.1I"
+    ),
+}
+
+_DESC_PLAIN = {
+    stage: tuple(d.replace("<sub>", "").replace("</sub>", "") for d in descs)
+    for stage, descs in _DESC_HTML.items()
+}
+
+@st.cache_data
+def compute_gridwork_loads(total_load, sec_spacing, sec_span, main_spacing, main_span, frame_spacing):
+    """Compute LVL gridwork member loads, bending moments and frame load.
+
+    Cached so widget interactions that do not change the gridwork inputs
+    reuse the previous result instead of recomputing on every rerun.
+    """
+    w_sec = total_load * sec_spacing / 1000  # kN/m
+    M_sec = w_sec * sec_span**2 / (8 * 1e6)  # kNm
+
+    w_main = w_sec * main_spacing / 1000     # kN/m
+    M_main = w_main * main_span**2 / (8 * 1e6)  # kNm
+
+    P_frame = w_main * frame_spacing / 1000  # kN
+
+    return w_sec, M_sec, w_main, M_main, P_frame
 
 def get_combination_description(stage, index):
     """Get the description text for each combination with proper formatting."""
-    if stage == "1":
-        descriptions = [
-            "1: 1.35G<sub>f</sub>",
-            "2: 1.2G<sub>f</sub> + 1.5Q<sub>w</sub> + 1.5Q<sub>m</sub> + 1.5Q<sub>h</sub> + 1W<sub>s</sub>",
-            "3: 1.2G<sub>f</sub> + 1W<sub>u</sub> + 1.5F<sub>w</sub>",
-            "4: 0.9G<sub>f</sub> + 1W<sub>u</sub> + 1.5F<sub>w</sub>",
-            "5: 1G<sub>f</sub> + 1.1I"
-        ]
-    elif stage == "2":
-        descriptions = [
-            "6: 1.35G<sub>f</sub> + 1.35G<sub>c</sub>",
-            "7: 1.2G<sub>f</sub> + 1.2G<sub>c</sub> + 1.5Q<sub>w</sub> + 1.5Q<sub>m</sub> + 1.5Q<sub>h</sub> + 1W<sub>s</sub> + 1.5F<sub>w</sub> + 1.5Q<sub>x</sub> + P<sub>c</sub>",
-            "8: 1G<sub>f</sub> + 1G<sub>c</sub> + 1.1I"
-        ]
-    elif stage == "3":
-        descriptions = [
-            "9: 1.35G<sub>f</sub> + 1.35G<sub>c</sub>",
-            "10: 1.2G<sub>f</sub> + 1.2G<sub>c</sub> + 1.5Q<sub>w</sub> + 1.5Q<sub>m</sub> + 1.5Q<sub>h</sub> + 1W<sub>s</sub> + 1.5F<sub>w</sub> + 1.5Q<sub>x</sub> + P<sub>c</sub>",
-            "11: 1.2G<sub>f</sub> + 1.2G<sub>c</sub> + 1.0W<sub>u</sub>",
-            "12: 1G<sub>f</sub> + 1G<sub>c</sub> + 1.1I"
-        ]
+    descriptions = _DESC_HTML[stage]
     return descriptions[index] if index < len(descriptions) else f"Combination {index+1}"
 
 def create_results_dataframe(combinations, stage, gamma_d):
-    """Create a pandas DataFrame for the results."""
-    data = []
-    for i, (vertical, horizontal) in enumerate(combinations):
-        desc = get_combination_description(stage, i).replace("<sub>", "").replace("</sub>", "")
-        data.append({
-            "Combination": desc,
-            "Vertical Load (kN/m²)": f"{vertical:.2f}",
-            "Horizontal Load (kN/m or kN/m²)": f"{horizontal:.2f}",
-            "γ_d": f"{gamma_d:.1f}"
-        })
-    return pd.DataFrame(data)
+    """Create a pandas DataFrame from the (vertical, horizontal) load arrays."""
+    import pandas as pd
+
+    verticals, horizontals = combinations
+    return pd.DataFrame({
+        "Combination": list(_DESC_PLAIN[stage][:len(verticals)]),
+        "Vertical Load (kN/m²)": np.char.mod("%.2f", verticals),
+        "Horizontal Load (kN/m or kN/m²)": np.char.mod("%.2f", horizontals),
+        "γ_d": f"{gamma_d:.1f}"
+    })
     
+# Shared HTTP session so repeated fetches reuse the TLS connection
+@st.cache_resource
+def _get_session():
+    import requests
+    return requests.Session()
+
+@st.cache_resource
 def download_logo():
-    """Download company logo for PDF report."""
-    logo_file = None
+    """Download company logo for PDF report (cached for the life of the process)."""
+    logo_file = "company_logo.png"
+    if os.path.exists(logo_file):
+        return logo_file
     for url in [LOGO_URL, FALLBACK_LOGO_URL]:
         try:
-            response = requests.get(url, stream=True, timeout=10)
+            response = _get_session().get(url, stream=True, timeout=(3, 10))
             if response.status_code == 200:
-                logo_file = "company_logo.png"
+                response.raw.decode_content = True
                 with open(logo_file, 'wb') as f:
-                    f.write(response.content)
-                break
+                    shutil.copyfileobj(response.raw, f)
+                return logo_file
         except Exception:
             continue
-    return logo_file if logo_file and os.path.exists(logo_file) else None
+    return None
+
+@st.cache_resource
+def get_logo_reader():
+    """Load the company logo into an ImageReader, decoded once per process."""
+    from reportlab.lib.utils import ImageReader
+
+    logo_file = download_logo()
+    if not logo_file:
+        return None
+    try:
+        with open(logo_file, 'rb') as f:
+            return ImageReader(io.BytesIO(f.read()))
+    except Exception:
+        return None
+
+@lru_cache(maxsize=1)
+def _report_styles():
+    """Build the ReportLab styles, table styles and column widths.
 
+    Constructed once, on the first PDF build; generate_pdf_report only
+    references the returned mapping. Custom styles are adjusted for
+    single-page fit.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.platypus import TableStyle
+
+    base = getSampleStyleSheet()
+
+    return {
+        'title': ParagraphStyle(
+            name='Title',
+            parent=base['Title'],
+            fontSize=14,  # Reduced from 16
+            leading=18,
+            alignment=TA_CENTER,
+            spaceAfter=8  # Reduced from 12
+        ),
+        'subtitle': ParagraphStyle(
+            name='Subtitle',
+            parent=base['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            spaceAfter=15
+        ),
+        'heading1': ParagraphStyle(
+            name='Heading1',
+            parent=base['Heading1'],
+            fontSize=14,
+            spaceBefore=20,
+            spaceAfter=10
+        ),
+        'heading2': ParagraphStyle(
+            name='Heading2',
+            parent=base['Heading2'],
+            fontSize=12,
+            spaceBefore=15,
+            spaceAfter=8
+        ),
+        'heading3': ParagraphStyle(
+            name='Heading3',
+            parent=base['Heading3'],
+            fontSize=11,  # Reduced from 12
+            spaceAfter=4  # Reduced from 6
+        ),
+        'normal': ParagraphStyle(
+            name='Normal',
+            parent=base['Normal'],
+            fontSize=10,
+            leading=12,
+            spaceAfter=8
+        ),
+        'table_header': ParagraphStyle(
+            name='TableHeader',
+            parent=base['Normal'],
+            fontSize=10,
+            leading=12,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER
+        ),
+        'cell': ParagraphStyle(
+            name='TableCell',
+            parent=base['Normal'],
+            fontSize=8,  # Reduced from 9
+            leading=9,   # Reduced from 11
+            alignment=TA_LEFT
+        ),
+        'cell_center': ParagraphStyle(
+            name='TableCellCenter',
+            parent=base['Normal'],
+            fontSize=8,  # Reduced from 9
+            leading=9,   # Reduced from 11
+            alignment=TA_CENTER
+        ),
+        'cols_inputs': [60*mm, 30*mm, 10*mm, 60*mm, 30*mm],
+        'cols_results': [100*mm, 40*mm, 50*mm],
+        'table_inputs': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ('ALIGN', (4, 0), (4, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ('LEFTPADDING', (0, 0), (-1, -1), 3),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+        ]),
+        'table_results': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ('LEFTPADDING', (0, 0), (-1, -1), 3),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+        ]),
+    }
+
+# Input parameter rows for the PDF report: (label, inputs key, value format)
+INPUT_PARAM_FIELDS = (
+    ("Formwork self-weight (G<sub>f</sub>)", "G_f", "%.2f kN/m²"),
+    ("Concrete thickness", "thickness", "%.2f m"),
+    ("Reinforcement percentage", "reinforcement_percentage", "%.1f%%"),
+    ("Concrete load (G<sub>c</sub>)", "G_c", "%.2f kN/m²"),
+    ("Workers & equipment - Stage 1 (Q<sub>w1</sub>)", "Q_w1", "%.2f kN/m²"),
+    ("Workers & equipment - Stage 2 (Q<sub>w2</sub>)", "Q_w2", "%.2f kN/m²"),
+    ("Workers & equipment - Stage 3 (Q<sub>w3</sub>)", "Q_w3", "%.2f kN/m²"),
+    ("Stacked materials (Q<sub>m</sub>)", "Q_m", "%.2f kN/m²"),
+    ("Horizontal imposed load (Q<sub>h</sub>)", "Q_h", "%.2f kN/m"),
+    ("Service wind load (W<sub>s</sub>)", "W_s", "%.2f kN/m²"),
+    ("Ultimate wind load (W<sub>u</sub>)", "W_u", "%.2f kN/m²"),
+    ("Flowing water load (F_w)", "F_w", "%.2f kN/m²"),
+    ("Other actions (Q<sub>x</sub>)", "Q_x", "%.2f kN/m²"),
+    ("Lateral concrete pressure (P<sub>c</sub>)", "P_c", "%.2f kN/m²"),
+    ("Impact load (I)", "I", "%.2f kN/m²"),
+)
+
+@lru_cache(maxsize=256)
+def _para(text, style_key):
+    """Return a shared Paragraph for the given text and style.
+
+    Paragraph rendering is position-independent, so identical cells (the
+    table headers, the many 0.00 values) can reuse one flowable across
+    tables instead of allocating a new one per cell.
+    """
+    from reportlab.platypus import Paragraph
+
+    return Paragraph(text, _report_styles()[style_key])
+
+def _make_result_table(combinations, stage):
+    """Build the three-column combination table from the raw load arrays."""
+    from reportlab.platypus import Table
+
+    styles = _report_styles()
+    verticals, horizontals = combinations
+    data = [[
+        _para("Combination", 'table_header'),
+        _para("Vertical Load<br/>(kN/m²)", 'table_header'),
+        _para("Horizontal Load<br/>(kN/m or kN/m²)", 'table_header')
+    ]]
+    data.extend(
+        [_para(desc, 'cell'), _para(f"{vertical:.2f}", 'cell_center'), _para(f"{horizontal:.2f}", 'cell_center')]
+        for desc, vertical, horizontal in zip(_DESC_HTML[stage], verticals.tolist(), horizontals.tolist())
+    )
+
+    table = Table(data, colWidths=styles['cols_results'])
+    table.setStyle(styles['table_results'])
+    return table
+
+@st.cache_data
 def generate_pdf_report(inputs, results, project_number, project_name):
-    """Generate a professional PDF report with company branding and header on all pages."""
+    """Generate a professional PDF report with company branding and header on all pages.
+
+    Cached on the inputs/results snapshot so reruns that do not change the
+    data reuse the previously built PDF bytes instead of re-running the
+    ReportLab layout engine.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+
+    styles = _report_styles()
+
     buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, 
+    doc = SimpleDocTemplate(buffer, pagesize=A4,
                           leftMargin=15*mm, rightMargin=15*mm,
                           topMargin=20*mm, bottomMargin=15*mm)  # Reduced top margin from 30*mm
-    
-    styles = getSampleStyleSheet()
-    
-    # Custom styles (adjusted for single-page fit)
-    title_style = ParagraphStyle(
-        name='Title',
-        parent=styles['Title'],
-        fontSize=14,  # Reduced from 16
-        leading=18,
-        alignment=TA_CENTER,
-        spaceAfter=8  # Reduced from 12
-    )
-    
-    subtitle_style = ParagraphStyle(
-        name='Subtitle',
-        parent=styles['Normal'],
-        fontSize=10,
-        alignment=TA_CENTER,
-        spaceAfter=15
-    )
-    
-    heading1_style = ParagraphStyle(
-        name='Heading1',
-        parent=styles['Heading1'],
-        fontSize=14,
-        spaceBefore=20,
-        spaceAfter=10
-    )
-    
-    heading2_style = ParagraphStyle(
-        name='Heading2',
-        parent=styles['Heading2'],
-        fontSize=12,
-        spaceBefore=15,
-        spaceAfter=8
-    )
-    
-    heading3_style = ParagraphStyle(
-        name='Heading3',
-        parent=styles['Heading3'],
-        fontSize=11,  # Reduced from 12
-        spaceAfter=4  # Reduced from 6
-    )
-    
-    normal_style = ParagraphStyle(
-        name='Normal',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=12,
-        spaceAfter=8
-    )
-    
-    table_header_style = ParagraphStyle(
-        name='TableHeader',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=12,
-        fontName='Helvetica-Bold',
-        alignment=TA_CENTER
-    )
-    
-    table_cell_style = ParagraphStyle(
-        name='TableCell',
-        parent=styles['Normal'],
-        fontSize=8,  # Reduced from 9
-        leading=9,   # Reduced from 11
-        alignment=TA_LEFT
-    )
-    
-    table_cell_center_style = ParagraphStyle(
-        name='TableCellCenter',
-        parent=styles['Normal'],
-        fontSize=8,  # Reduced from 9
-        leading=9,   # Reduced from 11
-        alignment=TA_CENTER
-    )
-    
+
     elements = []
     
     # Title and project info
-    elements.append(Paragraph("Load Combination Report for Falsework Design", title_style))
-    elements.append(Paragraph(f"to AS 3610.2 (Int):2023 - Strength Limit State", subtitle_style))
+    elements.append(Paragraph("Load Combination Report for Falsework Design", styles['title']))
+    elements.append(Paragraph(f"to AS 3610.2 (Int):2023 - Strength Limit State", styles['subtitle']))
     
     # Cleaned-up project_info string
     project_info = (
@@ -208,68 +407,33 @@ def generate_pdf_report(inputs, results, project_number, project_name):
         f"<b>Number:</b> {project_number}<br/>"
         f"<b>Date:</b> {datetime.now().strftime('%d %B %Y')}"
     )
-    elements.append(Paragraph(project_info, normal_style))
+    elements.append(Paragraph(project_info, styles['normal']))
     elements.append(Spacer(1, 8*mm))  # Reduced from 15*mm
     
     # Input Parameters section
-    elements.append(Paragraph("Input Parameters", heading1_style))
+    elements.append(Paragraph("Input Parameters", styles['heading1']))
     
     input_data = [
         ["Parameter", "Value", "", "Parameter", "Value"]
     ]
     
-    input_params = [
-        ("Formwork self-weight (G<sub>f</sub>)", f"{inputs['G_f']:.2f} kN/m²"),
-        ("Concrete thickness", f"{inputs['thickness']:.2f} m"),
-        ("Reinforcement percentage", f"{inputs['reinforcement_percentage']:.1f}%"),
-        ("Concrete load (G<sub>c</sub>)", f"{inputs['G_c']:.2f} kN/m²"),
-        ("Workers & equipment - Stage 1 (Q<sub>w1</sub>)", f"{inputs['Q_w1']:.2f} kN/m²"),
-        ("Workers & equipment - Stage 2 (Q<sub>w2</sub>)", f"{inputs['Q_w2']:.2f} kN/m²"),
-        ("Workers & equipment - Stage 3 (Q<sub>w3</sub>)", f"{inputs['Q_w3']:.2f} kN/m²"),
-        ("Stacked materials (Q<sub>m</sub>)", f"{inputs['Q_m']:.2f} kN/m²"),
-        ("Horizontal imposed load (Q<sub>h</sub>)", f"{inputs['Q_h']:.2f} kN/m"),
-        ("Service wind load (W<sub>s</sub>)", f"{inputs['W_s']:.2f} kN/m²"),
-        ("Ultimate wind load (W<sub>u</sub>)", f"{inputs['W_u']:.2f} kN/m²"),
-        ("Flowing water load (F_w)", f"{inputs['F_w']:.2f} kN/m²"),
-        ("Other actions (Q<sub>x</sub>)", f"{inputs['Q_x']:.2f} kN/m²"),
-        ("Lateral concrete pressure (P<sub>c</sub>)", f"{inputs['P_c']:.2f} kN/m²"),
-        ("Impact load (I)", f"{inputs['I']:.2f} kN/m²")
-    ]
-    
-    for i in range(0, len(input_params), 2):
-        row = []
-        row.append(Paragraph(input_params[i][0], table_cell_style))
-        row.append(Paragraph(input_params[i][1], table_cell_center_style))
-        row.append("")
-        if i+1 < len(input_params):
-            row.append(Paragraph(input_params[i+1][0], table_cell_style))
-            row.append(Paragraph(input_params[i+1][1], table_cell_center_style))
-        else:
-            row.append("")
-            row.append("")
-        input_data.append(row)
-    
-    input_table = Table(input_data, colWidths=[60*mm, 30*mm, 10*mm, 60*mm, 30*mm])
-    input_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ('ALIGN', (4, 0), (4, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-        ('LEFTPADDING', (0, 0), (-1, -1), 3),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-    ]))
+    cells = iter(
+        (Paragraph(label, styles['cell']),
+         Paragraph(fmt % inputs[key], styles['cell_center']))
+        for label, key, fmt in INPUT_PARAM_FIELDS
+    )
+    for left, right in zip_longest(cells, cells, fillvalue=("", "")):
+        input_data.append([left[0], left[1], "", right[0], right[1]])
+
+
+    input_table = Table(input_data, colWidths=styles['cols_inputs'])
+    input_table.setStyle(styles['table_inputs'])
     elements.append(input_table)
     # Removed PageBreak()
     
     # Results section
-    elements.append(Paragraph("Load Combination Results", heading1_style))
-    elements.append(Paragraph("Strength Limit State - AS 3610.2 (Int):2023 Table 3.3.1", subtitle_style))
+    elements.append(Paragraph("Load Combination Results", styles['heading1']))
+    elements.append(Paragraph("Strength Limit State - AS 3610.2 (Int):2023 Table 3.3.1", styles['subtitle']))
     elements.append(Spacer(1, 6*mm))  # Reduced from 10*mm
     
     for stage in ["1", "2", "3"]:
@@ -278,88 +442,34 @@ def generate_pdf_report(inputs, results, project_number, project_name):
             
         data = results[stage]
         stage_title = f"Stage {stage}: {data['description']}"
-        elements.append(Paragraph(stage_title, heading2_style))
+        elements.append(Paragraph(stage_title, styles['heading2']))
         elements.append(Spacer(1, 3*mm))  # Reduced from 5*mm
         
-        # Critical Members
-        elements.append(Paragraph("Critical Members (γ<sub>d</sub> = 1.3)", heading3_style))
-        
-        critical_data = [[
-            Paragraph("Combination", table_header_style),
-            Paragraph("Vertical Load<br/>(kN/m²)", table_header_style),
-            Paragraph("Horizontal Load<br/>(kN/m or kN/m²)", table_header_style)
-        ]]
-        
-        for i, (vertical, horizontal) in enumerate(data['critical']):
-            desc = get_combination_description(stage, i)
-            critical_data.append([
-                Paragraph(desc, table_cell_style),
-                Paragraph(f"{vertical:.2f}", table_cell_center_style),
-                Paragraph(f"{horizontal:.2f}", table_cell_center_style)
-            ])
-        
-        critical_table = Table(critical_data, colWidths=[100*mm, 40*mm, 50*mm])
-        critical_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-            ('LEFTPADDING', (0, 0), (-1, -1), 3),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-        ]))
-        elements.append(critical_table)
-        elements.append(Spacer(1, 6*mm))  # Reduced from 10*mm
-        
-        # Non-Critical Members
-        elements.append(Paragraph("Non-Critical Members (γ<sub>d</sub> = 1.0)", heading3_style))
-        
-        non_critical_data = [[
-            Paragraph("Combination", table_header_style),
-            Paragraph("Vertical Load<br/>(kN/m²)", table_header_style),
-            Paragraph("Horizontal Load<br/>(kN/m or kN/m²)", table_header_style)
-        ]]
-        
-        for i, (vertical, horizontal) in enumerate(data['non_critical']):
-            desc = get_combination_description(stage, i)
-            non_critical_data.append([
-                Paragraph(desc, table_cell_style),
-                Paragraph(f"{vertical:.2f}", table_cell_center_style),
-                Paragraph(f"{horizontal:.2f}", table_cell_center_style)
-            ])
-        
-        non_critical_table = Table(non_critical_data, colWidths=[100*mm, 40*mm, 50*mm])
-        non_critical_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-            ('LEFTPADDING', (0, 0), (-1, -1), 3),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-        ]))
-        elements.append(non_critical_table)
-        
+        # Critical then Non-Critical Members (same table layout, different data)
+        member_tables = [
+            ("Critical Members (γ<sub>d</sub> = 1.3)", data['critical']),
+            ("Non-Critical Members (γ<sub>d</sub> = 1.0)", data['non_critical'])
+        ]
+        for table_index, (label, combinations) in enumerate(member_tables):
+            elements.append(Paragraph(label, styles['heading3']))
+            elements.append(_make_result_table(combinations, stage))
+            if table_index == 0:
+                elements.append(Spacer(1, 6*mm))  # Reduced from 10*mm
+
         # Removed PageBreak()
     
+    # Fetch and decode the logo once per report rather than once per page
+    logo_reader = get_logo_reader()
+
     # Header and Footer drawing function
     def draw_header_footer(canvas, doc):
         canvas.saveState()
-        
+
         # Draw Header
-        logo_file = download_logo()
-        if logo_file:
+        if logo_reader:
             try:
-                logo = Image(logo_file, width=40*mm, height=15*mm)
-                logo.drawOn(canvas, 15*mm, A4[1] - 25*mm)  # Position logo at top-left
+                canvas.drawImage(logo_reader, 15*mm, A4[1] - 25*mm,
+                                 width=40*mm, height=15*mm, mask='auto')  # Position logo at top-left
             except:
                 pass
         
@@ -370,15 +480,13 @@ def generate_pdf_report(inputs, results, project_number, project_name):
         
         # Draw Footer
         canvas.setFont('Helvetica', 8)
-        footer_text = f"{PROGRAM} {PROGRAM_VERSION} | {COMPANY_NAME} © | Page {doc.page}"
-        canvas.drawCentredString(A4[0]/2.0, 10*mm, footer_text)
+        canvas.drawCentredString(A4[0]/2.0, 10*mm, FOOTER_PREFIX + str(doc.page))
         
         canvas.restoreState()
     
     # Build the document with header and footer on all pages
     doc.build(elements, onFirstPage=draw_header_footer, onLaterPages=draw_header_footer)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 def main():
     st.set_page_config(page_title="Load Combination Calculator", layout="wide")
@@ -447,18 +555,19 @@ def main():
 
             for stage, data in stages.items():
                 Q_w = data["Q_w"]
-                
-                # Critical Members (γ_d = 1.3)
-                critical_combinations = compute_combinations(
+
+                # The two member classes only differ in gamma_d, so compute
+                # the base combinations once and scale for each class
+                base_vertical, base_horizontal = compute_base_combinations(
                     G_f, inputs['G_c'], Q_w, Q_m, Q_h, W_s, W_u,
-                    F_w, Q_x, P_c, I, stage, gamma_d=1.3
+                    F_w, Q_x, P_c, I, stage
                 )
-                
+
+                # Critical Members (γ_d = 1.3)
+                critical_combinations = apply_gamma(base_vertical, base_horizontal, stage, 1.3)
+
                 # Non-Critical Members (γ_d = 1.0)
-                non_critical_combinations = compute_combinations(
-                    G_f, inputs['G_c'], Q_w, Q_m, Q_h, W_s, W_u,
-                    F_w, Q_x, P_c, I, stage, gamma_d=1.0
-                )
+                non_critical_combinations = apply_gamma(base_vertical, base_horizontal, stage, 1.0)
 
                 results[stage] = {
                     "description": data["description"],
@@ -494,17 +603,20 @@ def main():
         # Generate PDF and create download link (without button rerun)
         if st.session_state.inputs and st.session_state.results:
             with st.spinner("Generating PDF report..."):
-                pdf_buffer = generate_pdf_report(
-                    st.session_state.inputs, 
-                    st.session_state.results, 
-                    project_number, 
+                pdf_bytes = generate_pdf_report(
+                    st.session_state.inputs,
+                    st.session_state.results,
+                    project_number,
                     project_name
                 )
-                
-                # Create download link that won't rerun the script
-                b64 = base64.b64encode(pdf_buffer.getvalue()).decode()
-                href = f'<a href="data:application/pdf;base64,{b64}" download="Load_Combination_Report_{project_number}.pdf" style="display: inline-block; padding: 0.5em 1em; background-color: #f63366; color: white; border-radius: 0.5em; text-decoration: none;">Download PDF Report</a>'
-                st.markdown(href, unsafe_allow_html=True)
+                st.session_state.pdf_bytes = pdf_bytes
+
+            st.download_button(
+                "Download PDF Report",
+                data=pdf_bytes,
+                file_name=f"Load_Combination_Report_{project_number}.pdf",
+                mime="application/pdf"
+            )
 
     st.header("Slab Formwork Gridwork Design (LVL Beams)")
 
@@ -528,13 +640,9 @@ def main():
 
         st.markdown("### Calculations")
 
-        w_sec = total_load * sec_spacing / 1000  # kN/m
-        M_sec = w_sec * sec_span**2 / (8 * 1e6)  # kNm
-
-        w_main = w_sec * main_spacing / 1000     # kN/m
-        M_main = w_main * main_span**2 / (8 * 1e6)  # kNm
-
-        P_frame = w_main * frame_spacing / 1000  # kN
+        w_sec, M_sec, w_main, M_main, P_frame = compute_gridwork_loads(
+            total_load, sec_spacing, sec_span, main_spacing, main_span, frame_spacing
+        )
 
         st.markdown(f"**Secondary LVL** - Load = {w_sec:.2f} kN/m, Bending Moment = {M_sec:.2f} kNm")
         st.markdown(f"**Main LVL** - Load = {w_main:.2f} kN/m, Bending Moment = {M_main:.2f} kNm")